@@ -3,46 +3,67 @@ Sieve for Bitfinex API.
 Sieves orders that are not LIMIT and POST_ONLY for safe market-making.
 """
 
-from collections.abc import Callable
-from typing import Any
-
-from bfxapi import Client as BfxClient
+import asyncio
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from typing import Any, Final, SupportsIndex, cast
 
 
 class PostOnlyError(Exception):
     """Raised when an order violates POST_ONLY requirements or wrapper initialization fails."""
 
 
-def validate_post_only(**kwargs: Any) -> None:
-    """Only permit limit orders with POST_ONLY flag."""
-    order_type = kwargs.get("type", "").upper()
+_POST_ONLY: Final = 4096
+_LIMIT_TYPES: Final = frozenset({"LIMIT", "EXCHANGE LIMIT", "STOP LIMIT", "EXCHANGE STOP LIMIT"})
+_ERR_NOT_LIMIT: Final = "Only limit orders permitted, got: {}"
+_ERR_NO_POST_ONLY: Final = f"POST_ONLY flag ({_POST_ONLY}) required"
 
-    # Must be a limit order (contain "LIMIT")
-    if "LIMIT" not in order_type:
-        raise PostOnlyError(f"Only limit orders permitted, got: {order_type}")
 
-    # Must have POST_ONLY flag
-    flags = kwargs.get("flags", 0)
-    post_only_flag = 4096
-    if not (flags & post_only_flag):
-        raise PostOnlyError(f"POST_ONLY flag ({post_only_flag}) required")
+def _validate_fast(order_type: object, flags: object) -> None:
+    """Validate an already-extracted order type and flags value (any object: callers pass raw kwargs)."""
+    # Fast accept: canonical LIMIT type string and an int flags value carrying POST_ONLY
+    if type(order_type) is str and order_type in _LIMIT_TYPES and type(flags) is int and flags & _POST_ONLY:
+        return
 
+    # Slow path: find the violated rule. Must be a limit order (case-insensitive)
+    if not isinstance(order_type, str) or order_type.upper() not in _LIMIT_TYPES:
+        raise PostOnlyError(_ERR_NOT_LIMIT.format(order_type))
 
-def wrap_with_validation(original: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator to add POST_ONLY validation before calling the original method."""
+    # Must have POST_ONLY flag. Integer-like values (IntFlag, numpy ints) are coerced via __index__;
+    # bool, None, floats and strings are rejected
+    if isinstance(flags, bool):
+        raise PostOnlyError(_ERR_NO_POST_ONLY)
+    try:
+        # EAFP: the cast is checked at runtime by operator.index, whose TypeError is handled below
+        flags = operator.index(cast(SupportsIndex, flags))
+    except TypeError:
+        raise PostOnlyError(_ERR_NO_POST_ONLY) from None
+    if not (flags & _POST_ONLY):
+        raise PostOnlyError(_ERR_NO_POST_ONLY)
 
-    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-        validate_post_only(**kwargs)
-        return original(*args, **kwargs)
 
-    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-        validate_post_only(**kwargs)
-        return await original(*args, **kwargs)
+def validate_post_only(**kwargs: Any) -> None:
+    """Only permit limit orders with POST_ONLY flag."""
+    _validate_fast(kwargs.get("type", ""), kwargs.get("flags", 0))
 
-    # Return async or sync based on the original (assuming library methods are correctly typed)
-    if hasattr(original, "__await__"):
-        return async_wrapper
-    return sync_wrapper
+
+def _submit_validated(original: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Validate POST_ONLY compliance, then call the original submit method (or create its coroutine)."""
+    _validate_fast(kwargs.get("type", ""), kwargs.get("flags", 0))
+    return original(*args, **kwargs)
+
+
+def wrap_with_validation(original: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Bind POST_ONLY validation in front of the original method (C-level partial, no closure).
+    Async originals need no coroutine wrapper: validation runs on call and the
+    original coroutine is returned for the caller to await.
+    Already-wrapped methods are returned as-is so validation never runs twice.
+    """
+    if isinstance(original, partial) and original.func is _submit_validated:
+        return original
+    return partial(_submit_validated, original)
 
 
 class PostOnlyClient:
@@ -52,45 +73,68 @@ class PostOnlyClient:
     Assumes underlying bfxapi library provides REST and WebSocket submit_order methods.
     """
 
+    __slots__ = ("_client", "rest", "wss", "_rest_submit", "_wss_submit")
+
     def __init__(self, api_key: str | None = None, api_secret: str | None = None, **kwargs: Any):
         """Initialize with POST_ONLY validation wrapper."""
+        # Imported lazily: bfxapi pulls in its whole transport stack, which plain validation does not need
+        from bfxapi import Client as BfxClient
+
         self._client = BfxClient(api_key=api_key, api_secret=api_secret, **kwargs)
 
         # Wrap REST submit_order with validation
-        if not (hasattr(self._client.rest, "auth") and hasattr(self._client.rest.auth, "submit_order")):
-            raise PostOnlyError("REST submit_order method not found in bfxapi.rest.auth")
+        try:
+            rest_auth = self._client.rest.auth
+            rest_submit = rest_auth.submit_order
+        except AttributeError:
+            raise PostOnlyError("REST submit_order method not found in bfxapi.rest.auth") from None
 
-        self._client.rest.auth.submit_order = wrap_with_validation(self._client.rest.auth.submit_order)
+        rest_auth.submit_order = wrap_with_validation(rest_submit)
 
         # Wrap WebSocket submit_order with validation (mandatory)
-        if not (
-            hasattr(self._client, "wss")
-            and hasattr(self._client.wss, "inputs")
-            and hasattr(self._client.wss.inputs, "submit_order")
-        ):
-            raise PostOnlyError("WebSocket submit_order method not found in bfxapi.wss.inputs")
+        try:
+            wss_inputs = self._client.wss.inputs
+            wss_submit = wss_inputs.submit_order
+        except AttributeError:
+            raise PostOnlyError("WebSocket submit_order method not found in bfxapi.wss.inputs") from None
 
-        self._client.wss.inputs.submit_order = wrap_with_validation(self._client.wss.inputs.submit_order)
+        wss_inputs.submit_order = wrap_with_validation(wss_submit)
 
-    @property
-    def rest(self) -> Any:
-        """Access wrapped REST client."""
-        return self._client.rest
+        # Bind wrapped REST and WebSocket clients directly (no property or __getattr__ dispatch)
+        self.rest: Any = self._client.rest
+        self.wss: Any = self._client.wss
 
-    @property
-    def wss(self) -> Any:
-        """Access wrapped WebSocket client."""
-        return self._client.wss
+        # Bind wrapped submit_order once for the convenience methods (no attribute walk per call)
+        self._rest_submit = rest_auth.submit_order
+        self._wss_submit = wss_inputs.submit_order
 
     def submit_limit_order(self, symbol: str, amount: float, price: float, **kwargs: Any) -> Any:
-        """Submit limit order via REST. Validates POST_ONLY flag is present."""
-        return self.rest.auth.submit_order(type="EXCHANGE LIMIT", symbol=symbol, amount=amount, price=price, **kwargs)
+        """Submit EXCHANGE LIMIT order via REST. Validates POST_ONLY flag is present."""
+        return self._rest_submit(type="EXCHANGE LIMIT", symbol=symbol, amount=amount, price=price, **kwargs)
 
     async def submit_limit_order_async(self, symbol: str, amount: float, price: float, **kwargs: Any) -> Any:
-        """Submit limit order via WebSocket. Validates POST_ONLY flag is present."""
-        return await self.wss.inputs.submit_order(
-            type="EXCHANGE LIMIT", symbol=symbol, amount=amount, price=price, **kwargs
-        )
-
-    def __getattr__(self, name: str) -> Any:
-        return getattr(self._client, name)
+        """Submit EXCHANGE LIMIT order via WebSocket. Validates POST_ONLY flag is present."""
+        return await self._wss_submit(type="EXCHANGE LIMIT", symbol=symbol, amount=amount, price=price, **kwargs)
+
+    def cancel_limit_orders(self, ids: Iterable[int]) -> Any:
+        """Cancel a batch of orders by id in one REST request. Cancels cannot violate POST_ONLY."""
+        return self.rest.auth.cancel_order_multi(id=list(ids))
+
+    async def submit_limit_orders_async(self, orders: Iterable[Mapping[str, Any]]) -> list[Any]:
+        """
+        Submit a batch of limit orders concurrently via WebSocket.
+        Each order holds submit_limit_order_async keyword arguments (symbol, amount, price, flags, ...).
+        Validates the whole batch before sending anything, so one bad order rejects the batch.
+        Returns one entry per order, in order: its result, or the exception its submission raised.
+        """
+        # The wrapped submit validates on call, before its coroutine runs: create all, send none on rejection
+        pending = []
+        try:
+            for order in orders:
+                pending.append(self._wss_submit(type="EXCHANGE LIMIT", **order))
+        except BaseException:
+            for coro in pending:
+                coro.close()
+            raise
+        # Orders are sent independently, so one failed send must not hide the outcome of the others
+        return await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,154 @@
+"""Tests for POST_ONLY validation and the PostOnlyClient wrapper"""
+
+import enum
+import subprocess
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from bfx_postonly import PostOnlyClient, PostOnlyError, validate_post_only
+from bfx_postonly.client import wrap_with_validation
+
+
+class Flag(enum.IntFlag):
+    HIDDEN = 64
+    POST_ONLY = 4096
+
+
+class IndexInt:
+    """Non-int integer-like value (like numpy.int64): usable through __index__ only."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __index__(self) -> int:
+        return self.value
+
+    def __and__(self, other: int) -> int:
+        return self.value & other
+
+
+@pytest.fixture
+def bfx(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """
+    Stub bfxapi module; PostOnlyClient imports bfxapi lazily, so sys.modules is enough.
+    Returns the raw client plus the original submit mocks (the client replaces them with wrappers).
+    """
+    mocks = SimpleNamespace(rest_submit=Mock(), wss_submit=AsyncMock(), cancel_multi=Mock())
+    mocks.raw = SimpleNamespace(
+        rest=SimpleNamespace(
+            auth=SimpleNamespace(submit_order=mocks.rest_submit, cancel_order_multi=mocks.cancel_multi)
+        ),
+        wss=SimpleNamespace(inputs=SimpleNamespace(submit_order=mocks.wss_submit)),
+    )
+    module = ModuleType("bfxapi")
+    module.Client = lambda **kwargs: mocks.raw  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "bfxapi", module)
+    return mocks
+
+
+@pytest.fixture
+def client(bfx: SimpleNamespace) -> PostOnlyClient:
+    return PostOnlyClient(api_key="test", api_secret="test")
+
+
+class TestValidation:
+    @pytest.mark.parametrize("order_type", ["LIMIT", "EXCHANGE LIMIT", "STOP LIMIT", "exchange limit"])
+    def test_limit_types_accepted(self, order_type: str) -> None:
+        validate_post_only(type=order_type, flags=4096)
+
+    def test_int_flag_subclass_accepted(self) -> None:
+        validate_post_only(type="EXCHANGE LIMIT", flags=Flag.POST_ONLY | Flag.HIDDEN)
+
+    def test_index_flag_accepted(self) -> None:
+        validate_post_only(type="EXCHANGE LIMIT", flags=IndexInt(4096 | 64))
+
+    @pytest.mark.parametrize("order_type", ["EXCHANGE MARKET", "STOP", "FOK", None, 7, ["LIMIT"]])
+    def test_non_limit_types_rejected(self, order_type: object) -> None:
+        with pytest.raises(PostOnlyError, match="Only limit orders permitted"):
+            validate_post_only(type=order_type, flags=4096)
+
+    @pytest.mark.parametrize("flags", [0, 64, Flag.HIDDEN, IndexInt(64), True, None, "4096", 4096.0])
+    def test_missing_or_non_int_flags_rejected(self, flags: object) -> None:
+        with pytest.raises(PostOnlyError, match=r"POST_ONLY flag \(4096\) required"):
+            validate_post_only(type="EXCHANGE LIMIT", flags=flags)
+
+    def test_wrap_is_idempotent(self) -> None:
+        wrapped = wrap_with_validation(Mock())
+        assert wrap_with_validation(wrapped) is wrapped
+
+
+class TestPostOnlyClient:
+    def test_rest_and_wss_exposed(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        assert client.rest is bfx.raw.rest
+        assert client.wss is bfx.raw.wss
+
+    def test_rest_compliant_order_forwarded(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        client.submit_limit_order("tBTCUSD", 0.001, 30000.0, flags=4096)
+        bfx.rest_submit.assert_called_once_with(
+            type="EXCHANGE LIMIT", symbol="tBTCUSD", amount=0.001, price=30000.0, flags=4096
+        )
+
+    def test_rest_rejected_order_not_sent(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        with pytest.raises(PostOnlyError):
+            client.rest.auth.submit_order(type="EXCHANGE MARKET", symbol="tBTCUSD", amount=0.001, flags=4096)
+        bfx.rest_submit.assert_not_called()
+
+    def test_convenience_type_cannot_be_overridden(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        with pytest.raises(TypeError):
+            client.submit_limit_order("tBTCUSD", 0.001, 30000.0, type="LIMIT", flags=4096)
+        bfx.rest_submit.assert_not_called()
+
+    async def test_wss_compliant_order_forwarded(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        await client.submit_limit_order_async("tBTCUSD", 0.001, 30000.0, flags=4096)
+        bfx.wss_submit.assert_awaited_once_with(
+            type="EXCHANGE LIMIT", symbol="tBTCUSD", amount=0.001, price=30000.0, flags=4096
+        )
+
+    async def test_wss_rejected_order_not_sent(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        with pytest.raises(PostOnlyError):
+            await client.wss.inputs.submit_order(type="EXCHANGE LIMIT", symbol="tBTCUSD", amount=0.001, price=1.0)
+        bfx.wss_submit.assert_not_called()
+
+    async def test_batch_submitted(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        orders = [
+            {"symbol": "tBTCUSD", "amount": 0.001, "price": 29900.0, "flags": 4096},
+            {"symbol": "tBTCUSD", "amount": -0.001, "price": 30100.0, "flags": 4096},
+        ]
+        results = await client.submit_limit_orders_async(orders)
+        assert len(results) == 2
+        assert bfx.wss_submit.await_count == 2
+
+    async def test_batch_returns_send_failures_per_order(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        error = ConnectionError("socket closed")
+        bfx.wss_submit.side_effect = ["ok", error]
+        orders = [
+            {"symbol": "tBTCUSD", "amount": 0.001, "price": 29900.0, "flags": 4096},
+            {"symbol": "tBTCUSD", "amount": -0.001, "price": 30100.0, "flags": 4096},
+        ]
+        assert await client.submit_limit_orders_async(orders) == ["ok", error]
+
+    async def test_batch_with_bad_order_sends_nothing(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        orders = [
+            {"symbol": "tBTCUSD", "amount": 0.001, "price": 29900.0, "flags": 4096},
+            {"symbol": "tBTCUSD", "amount": -0.001, "price": 30100.0},
+        ]
+        with pytest.raises(PostOnlyError):
+            await client.submit_limit_orders_async(orders)
+        bfx.wss_submit.assert_not_awaited()
+
+    def test_cancel_limit_orders(self, client: PostOnlyClient, bfx: SimpleNamespace) -> None:
+        client.cancel_limit_orders(iter([1, 2]))
+        bfx.cancel_multi.assert_called_once_with(id=[1, 2])
+
+    def test_missing_submit_order_raises(self, bfx: SimpleNamespace) -> None:
+        del bfx.raw.wss.inputs.submit_order
+        with pytest.raises(PostOnlyError, match="WebSocket submit_order method not found"):
+            PostOnlyClient(api_key="test", api_secret="test")
+
+
+def test_import_does_not_load_bfxapi() -> None:
+    code = "import sys, bfx_postonly; assert 'bfxapi' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)